@@ -89,17 +89,31 @@ def postgres():
     # below the level that makes the server terminate freshly started walsenders
     # under load. Held for the whole test (incl. the forked streaming reader).
     with postgres_concurrency_slot():
-        yield PostgresContext()
+        ctx = PostgresContext()
+        try:
+            yield ctx
+        finally:
+            # Hand the connection back to the per-worker pool so the next test
+            # skips the connect + handshake.
+            ctx.close()
 
 
 @pytest.fixture
 def postgres_with_tls():
-    return PostgresWithTlsContext()
+    ctx = PostgresWithTlsContext()
+    try:
+        yield ctx
+    finally:
+        ctx.close()
 
 
 @pytest.fixture
 def pgvector():
-    return PgvectorContext()
+    ctx = PgvectorContext()
+    try:
+        yield ctx
+    finally:
+        ctx.close()
 
 
 @pytest.fixture
@@ -124,7 +138,11 @@ def neon():
 
 @pytest.fixture
 def questdb():
-    return QuestDBContext()
+    ctx = QuestDBContext()
+    try:
+        yield ctx
+    finally:
+        ctx.close()
 
 
 @pytest.fixture
@@ -1,3 +1,4 @@
+import asyncio
 import functools
 import json
 import pathlib
@@ -6,7 +7,14 @@ import time
 
 import pytest
 import requests
-from utils import DEBEZIUM_CONNECTOR_URL, KAFKA_SETTINGS
+from utils import (
+    DEBEZIUM_CONNECTOR_URL,
+    KAFKA_SETTINGS,
+    DebeziumContext,
+    PostgresContext,
+    build_contexts,
+    postgres_concurrency_slot,
+)
 
 import pathway as pw
 from pathway.tests.utils import wait_result_with_checker
@@ -126,3 +134,71 @@ def test_debezium_postgres(tmp_path, postgres, debezium):
     inputs_thread = threading.Thread(target=stream_data, daemon=True)
     inputs_thread.start()
     wait_result_with_checker(SumChecker(output_path, expected_sum), 180, step=1.0)
+
+
+def _wait_for_connector_running(name: str, timeout_sec: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout_sec
+    while True:
+        r = requests.get(f"{DEBEZIUM_CONNECTOR_URL}/{name}/status", timeout=60)
+        if r.status_code == 200:
+            status = r.json()
+            states = [status["connector"]["state"]] + [
+                task["state"] for task in status["tasks"]
+            ]
+            if status["tasks"] and all(state == "RUNNING" for state in states):
+                return
+            assert "FAILED" not in states, status
+        if time.monotonic() >= deadline:
+            raise AssertionError(f"Connector {name} is not running: {r.text}")
+        time.sleep(1.0)
+
+
+@xfail_if_debezium_failed_to_start
+def test_debezium_register_connectors_concurrently():
+    class InputSchema(pw.Schema):
+        value: int
+
+    with postgres_concurrency_slot():
+        contexts = build_contexts([PostgresContext, DebeziumContext])
+        postgres = contexts[PostgresContext]
+        debezium = contexts[DebeziumContext]
+        table_names = []
+        connector_names = []
+        try:
+            for _ in range(3):
+                table_names.append(
+                    postgres.create_table(InputSchema, add_special_fields=False)
+                )
+
+            async def register_all() -> list[str | BaseException]:
+                return await asyncio.gather(
+                    *(
+                        debezium.register_postgres_async(table_name)
+                        for table_name in table_names
+                    ),
+                    return_exceptions=True,
+                )
+
+            results = asyncio.run(register_all())
+            # Collect every registered connector before surfacing a failure, so
+            # the ``finally`` below deletes them all.
+            topic_names = [r for r in results if isinstance(r, str)]
+            connector_ids = [topic_name.split(".", 1)[0] for topic_name in topic_names]
+            connector_names = [
+                f"values-connector-{connector_id}" for connector_id in connector_ids
+            ]
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+            assert len(set(connector_ids)) == len(table_names)
+            for topic_name, table_name in zip(topic_names, table_names):
+                assert topic_name.split(".", 1)[1] == f"public.{table_name}"
+            for connector_name in connector_names:
+                _wait_for_connector_running(connector_name)
+        finally:
+            for connector_name in connector_names:
+                debezium.delete_connector(connector_name)
+            for table_name in table_names:
+                postgres.execute_sql(f"DROP TABLE IF EXISTS {table_name}")
+            postgres.close()
@@ -539,6 +539,29 @@ def _mysql_write(table, *, table_name, init_mode):
     pw.run()
 
 
+def test_mysql_insert_rows_fills_missing_keys_with_null(mysql):
+    table_name = mysql.random_table_name()
+    mysql.cursor.execute(
+        f"CREATE TABLE {table_name} (k BIGINT, name VARCHAR(255), v BIGINT)"
+    )
+
+    mysql.insert_rows(
+        table_name,
+        [
+            {"k": 1, "name": "a", "v": 10},
+            {"k": 2, "name": "b"},
+            {"k": 3, "v": 30},
+        ],
+    )
+
+    result = mysql.get_table_contents(table_name, ["k", "name", "v"], "k")
+    assert result == [
+        {"k": 1, "name": "a", "v": 10},
+        {"k": 2, "name": "b", "v": None},
+        {"k": 3, "name": None, "v": 30},
+    ]
+
+
 def test_mysql_write_table_name_with_special_characters(mysql):
     """Shared regression for identifier quoting in SQL writers.
     Unverified in this harness — see
@@ -785,8 +808,13 @@ def test_mysql_read_streaming_reflects_inserts_updates_deletes(mysql):
         f"CREATE TABLE {input_table} "
         f"(id BIGINT PRIMARY KEY, name VARCHAR(255), value DOUBLE)"
     )
-    for identity, name, value in [(1, "a", 1.0), (2, "b", 2.0), (3, "c", 3.0)]:
-        mysql.insert_row(input_table, {"id": identity, "name": name, "value": value})
+    mysql.insert_rows(
+        input_table,
+        [
+            {"id": identity, "name": name, "value": value}
+            for identity, name, value in [(1, "a", 1.0), (2, "b", 2.0), (3, "c", 3.0)]
+        ],
+    )
 
     class InputSchema(pw.Schema):
         id: int = pw.column_definition(primary_key=True)
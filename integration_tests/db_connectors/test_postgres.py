@@ -166,6 +166,27 @@ def test_psql_write_snapshot_single_column(postgres):
     assert result == [{"a": 1}, {"a": 2}, {"a": 3}]
 
 
+def test_psql_insert_rows_fills_missing_keys_with_null(postgres):
+    table_name = postgres.random_table_name()
+    postgres.execute_sql(f"CREATE TABLE {table_name} (k BIGINT, name TEXT, v BIGINT)")
+
+    postgres.insert_rows(
+        table_name,
+        [
+            {"k": 1, "name": "a", "v": 10},
+            {"k": 2, "name": "b"},
+            {"k": 3, "v": 30},
+        ],
+    )
+
+    result = postgres.get_table_contents(table_name, ["k", "name", "v"], "k")
+    assert result == [
+        {"k": 1, "name": "a", "v": 10},
+        {"k": 2, "name": "b", "v": None},
+        {"k": 3, "name": None, "v": 30},
+    ]
+
+
 def test_psql_write_snapshot_only_primary_keys(postgres):
     class InputSchema(pw.Schema):
         a: int
@@ -1,6 +1,9 @@
+import asyncio
 import fcntl
+import functools
 import json
 import logging
+import operator
 import os
 import random
 import tempfile
@@ -9,19 +12,25 @@ import time
 import types as builtin_types
 import uuid
 from collections.abc import Sequence
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from dataclasses import dataclass
 from typing import Any, Union, cast, get_args, get_origin
 
 import boto3
 import mysql.connector
+import mysql.connector.pooling
 import numpy as np
 import pandas as pd
 import psycopg2
+import psycopg2.pool
 import pymssql
 import requests
+from psycopg2.extras import execute_values
 from pymongo import MongoClient
 from pymongo.operations import SearchIndexModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import pathway as pw
 from pathway.internals import api, dtype
@@ -151,7 +160,9 @@ KAFKA_SETTINGS = {
     "auto.offset.reset": "earliest",
 }
 
-DEBEZIUM_CONNECTOR_URL = "http://debezium:8083/connectors"
+DEBEZIUM_URL = "http://debezium:8083"
+DEBEZIUM_CONNECTOR_URL = f"{DEBEZIUM_URL}/connectors"
+DEBEZIUM_REGISTER_TIMEOUT_SEC = 300.0
 
 MYSQL_DB_HOST = "mysql"
 # A second, otherwise-identical MySQL booted with `--local-infile=ON`. The
@@ -396,8 +407,25 @@ def elasticsearch_concurrency_slot():
         yield
 
 
-def _connect_to_mysql(host: str = MYSQL_DB_HOST, timeout_sec: float = 120.0):
-    """Open a MySQL connection, waiting for the server to become reachable.
+def _mysql_settings(host: str) -> dict:
+    return {
+        "host": host,
+        "port": MYSQL_DB_PORT,
+        "database": MYSQL_DB_NAME,
+        "user": MYSQL_DB_USER,
+        "password": MYSQL_DB_PASSWORD,
+        "autocommit": True,
+        # The C extension decodes the wire protocol natively, which is much
+        # faster than the pure-Python implementation on large result sets.
+        "use_pure": False,
+        # Discard a result set left unread on ``self.cursor`` by an ad-hoc
+        # query instead of failing the next statement with "Unread result found".
+        "consume_results": True,
+    }
+
+
+def _wait_for_mysql(connect, timeout_sec: float = 120.0):
+    """Call ``connect`` until the MySQL server accepts it.
 
     The official ``mysql`` Docker image briefly runs a socket-only temporary
     server (``--skip-networking``) while it creates the user and database during
@@ -412,14 +440,7 @@ def _connect_to_mysql(host: str = MYSQL_DB_HOST, timeout_sec: float = 120.0):
     delay = 0.5
     while True:
         try:
-            return mysql.connector.connect(
-                host=host,
-                port=MYSQL_DB_PORT,
-                database=MYSQL_DB_NAME,
-                user=MYSQL_DB_USER,
-                password=MYSQL_DB_PASSWORD,
-                autocommit=True,
-            )
+            return connect()
         except mysql.connector.Error:
             if time.monotonic() >= deadline:
                 raise
@@ -427,12 +448,178 @@ def _connect_to_mysql(host: str = MYSQL_DB_HOST, timeout_sec: float = 120.0):
             delay = min(delay * 1.5, 2.0)
 
 
+def _connect_to_mysql(host: str = MYSQL_DB_HOST, timeout_sec: float = 120.0):
+    """Open a dedicated MySQL connection, waiting for the server to become
+    reachable (see ``_wait_for_mysql``)."""
+    return _wait_for_mysql(
+        lambda: mysql.connector.connect(**_mysql_settings(host)), timeout_sec
+    )
+
+
+# Opening a server connection (TCP + handshake + auth) dominates the cost of a
+# short test, and every test builds at least one context. Contexts therefore
+# borrow their connection from a per-process pool (one per server) and hand it
+# back on ``close``, so consecutive tests in an xdist worker reuse the same
+# socket. The pools are created lazily, on first use. When every pooled
+# connection is checked out, a context falls back to a dedicated connection
+# instead of failing.
+#
+# PostgreSQL: ``ThreadedConnectionPool`` only keeps ``minconn`` idle
+# connections around, so the cap merely bounds how many a worker can hold at
+# once.
+POSTGRES_POOL_MAX_CONNECTIONS = 25
+_pg_pools: dict[tuple, psycopg2.pool.ThreadedConnectionPool] = {}
+_pg_pools_lock = threading.Lock()
+# MySQL: ``MySQLConnectionPool`` opens all of its connections upfront and keeps
+# them open, so keep it small — a test holds the fixture's context plus at most
+# one helper-thread context — to stay clear of ``ERROR 1040 (Too many
+# connections)`` under xdist.
+MYSQL_POOL_SIZE = 2
+_mysql_pools: dict[str, mysql.connector.pooling.MySQLConnectionPool] = {}
+_mysql_pools_lock = threading.Lock()
+
+
+def _get_pg_pool(**settings) -> psycopg2.pool.ThreadedConnectionPool:
+    key = tuple(sorted(settings.items()))
+    with _pg_pools_lock:
+        pool = _pg_pools.get(key)
+        if pool is None:
+            pool = psycopg2.pool.ThreadedConnectionPool(
+                minconn=1, maxconn=POSTGRES_POOL_MAX_CONNECTIONS, **settings
+            )
+            _pg_pools[key] = pool
+        return pool
+
+
+def _borrow_pg_connection(pool: psycopg2.pool.ThreadedConnectionPool):
+    """Take an autocommit connection from ``pool``, making sure it is alive.
+
+    Unlike ``MySQLConnectionPool.get_connection``, the psycopg2 pool hands out
+    idle connections unchecked, and ``putconn`` keeps one whose server side has
+    gone (psycopg2 still reports it idle until it is used). Probe it with a
+    ``SELECT 1`` and replace it if that fails, so one test's dropped connection
+    can't break the next test in the same worker. The replacement is not
+    probed again: if the server is really down, let its first query fail.
+    """
+    connection = pool.getconn()
+    try:
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        return connection
+    except psycopg2.Error:
+        pool.putconn(connection, close=True)
+    connection = pool.getconn()
+    connection.autocommit = True
+    return connection
+
+
+def _acquire_mysql_connection(host: str = MYSQL_DB_HOST):
+    with _mysql_pools_lock:
+        pool = _mysql_pools.get(host)
+        if pool is None:
+            pool = _wait_for_mysql(
+                lambda: mysql.connector.pooling.MySQLConnectionPool(
+                    pool_name=f"pw_{host}",
+                    pool_size=MYSQL_POOL_SIZE,
+                    **_mysql_settings(host),
+                )
+            )
+            _mysql_pools[host] = pool
+    try:
+        return pool.get_connection()
+    except mysql.connector.errors.PoolError:
+        return _connect_to_mysql(host)
+
+
 @dataclass(frozen=True)
 class ColumnProperties:
     type_name: str
     is_nullable: bool
 
 
+# SQL column types ``create_table`` uses for each Pathway dtype.
+_PG_TYPEMAP: dict[dtype.DType, str] = {
+    dtype.STR: "TEXT",
+    dtype.INT: "BIGINT",
+    dtype.FLOAT: "DOUBLE PRECISION",
+    dtype.BOOL: "BOOLEAN",
+}
+_MYSQL_TYPEMAP: dict[dtype.DType, str] = {
+    dtype.STR: "VARCHAR(255)",
+    dtype.INT: "BIGINT",
+    dtype.FLOAT: "DOUBLE",
+    dtype.BOOL: "BOOLEAN",
+}
+
+
+def _build_create_table(
+    typemap: dict[dtype.DType, str],
+    schema: type[pw.Schema],
+    quote_char: str,
+    *,
+    add_special_fields: bool,
+    array_types: dict[str, str] | None = None,
+) -> list[str]:
+    """Column definitions of a ``CREATE TABLE`` for ``schema``.
+
+    Arrays have no single SQL type, so they are only accepted for columns whose
+    name contains one of the ``array_types`` markers, which gives the type.
+    """
+    primary_key_found = False
+    fields = []
+    for field_name, field_schema in schema.columns().items():
+        field_type = field_schema.dtype
+        sql_type = typemap.get(field_type)
+        if sql_type is None and isinstance(field_type, dtype.Array):
+            sql_type = next(
+                (
+                    array_type
+                    for marker, array_type in (array_types or {}).items()
+                    if marker in field_name
+                ),
+                None,
+            )
+        if sql_type is None:
+            raise RuntimeError(f"This test doesn't support field type {field_type}")
+        parts = [f"{quote_char}{field_name}{quote_char}", sql_type]
+        if field_schema.primary_key:
+            if primary_key_found:
+                raise AssertionError("This test only supports simple primary keys")
+            primary_key_found = True
+            parts.append("PRIMARY KEY NOT NULL")
+        fields.append(" ".join(parts))
+
+    if add_special_fields:
+        fields.append(f"{quote_char}time{quote_char} BIGINT NOT NULL")
+        fields.append(f"{quote_char}diff{quote_char} BIGINT NOT NULL")
+    return fields
+
+
+@functools.lru_cache(maxsize=128)
+def _insert_sql(table_name: str, field_names: tuple[str, ...]) -> str:
+    """Single-row ``INSERT`` with ``%s`` placeholders, built once per table and
+    column order: fixtures insert many rows with the same shape."""
+    placeholders = ",".join(["%s"] * len(field_names))
+    return f"INSERT INTO {table_name} ({','.join(field_names)}) VALUES ({placeholders})"
+
+
+def _order_by_clause(sort_by: str | tuple | None, column_names: list[str]) -> str:
+    """``ORDER BY`` for the ``sort_by`` argument of ``get_table_contents``.
+
+    Sort keys are spliced into the query, so only the selected columns are
+    accepted. Rows come back in the server's ordering, i.e. text follows the
+    column's collation.
+    """
+    if sort_by is None:
+        return ""
+    keys = sort_by if isinstance(sort_by, tuple) else (sort_by,)
+    for key in keys:
+        if key not in column_names:
+            raise ValueError(f"Cannot sort by {key!r}: not among {column_names}")
+    return f" ORDER BY {','.join(keys)}"
+
+
 class SimpleObject:
     def __init__(self, a):
         self.a = a
@@ -446,110 +633,145 @@ class WireProtocolSupporterContext:
     def __init__(
         self, *, host: str, port: int, database: str, user: str, password: str
     ):
-        self.connection = psycopg2.connect(
-            host=host,
-            port=port,
-            database=database,
-            user=user,
-            password=password,
+        settings = {
+            "host": host,
+            "port": port,
+            "database": database,
+            "user": user,
+            "password": password,
+        }
+        self._pool: psycopg2.pool.ThreadedConnectionPool | None = _get_pg_pool(
+            **settings
         )
-        self.connection.autocommit = True
-        self.cursor = self.connection.cursor()
+        try:
+            self.connection = _borrow_pg_connection(self._pool)
+        except psycopg2.pool.PoolError:
+            self._pool = None
+            self.connection = psycopg2.connect(**settings)
+            self.connection.autocommit = True
         # A single psycopg2 cursor holds one result set and one read position,
         # so it must not be used by two threads at once: an ``execute`` in one
         # thread replaces the result set the other thread is about to
         # ``fetchall``, which then returns the wrong rows -- or none at all,
         # because the interleaved fetch already consumed them. Tests routinely
         # stream input from a helper thread (whose progress checker polls this
-        # context) while the main thread queries the same context, so every
-        # statement issued through this class takes this lock and holds it for
-        # the whole execute + fetch.
+        # context) while the main thread queries the same context. The helpers
+        # below therefore each open their own short-lived cursor (the connection
+        # itself is thread-safe), while ``self.cursor`` -- kept for
+        # ``execute_sql`` and the ad-hoc queries tests issue directly -- is
+        # shared, so every statement issued through it takes this lock and
+        # holds it for the whole execute + fetch.
+        self.cursor = self.connection.cursor()
         self._lock = threading.RLock()
+        # ``get_table_schema`` results by ``(table_name, schema)``. Dropped
+        # whenever this context runs DDL itself; tables are otherwise not
+        # altered once a test has inspected them.
+        self._schema_cache: dict[tuple[str, str], dict[str, ColumnProperties]] = {}
+
+    def close(self, *, discard: bool = False) -> None:
+        """Release the connection: hand it back to the shared pool (or, with
+        ``discard``, make the pool drop it), or close it if it is a dedicated
+        one."""
+        try:
+            self.cursor.close()
+        except Exception:
+            pass
+        if self._pool is None:
+            self.connection.close()
+        else:
+            # The pool itself drops connections psycopg2 knows are closed.
+            self._pool.putconn(self.connection, close=discard)
 
     def get_table_schema(
         self, table_name: str, schema: str = "public"
     ) -> dict[str, ColumnProperties]:
+        cached = self._schema_cache.get((table_name, schema))
+        if cached is not None:
+            return dict(cached)
+
+        # Reads the catalog directly: ``information_schema.columns`` is a view
+        # joining a dozen catalog tables and is far slower. The relation kinds,
+        # type name (``data_type``, with domains reported as their base type)
+        # and nullability follow the view's definition.
         query = """
             SELECT
-                column_name,
-                data_type,
-                is_nullable
-            FROM information_schema.columns
-            WHERE table_name = %s AND table_schema = %s
-            ORDER BY ordinal_position;
+                a.attname,
+                CASE
+                    WHEN t.typtype = 'd' THEN
+                        CASE
+                            WHEN bt.typelem <> 0 AND bt.typlen = -1 THEN 'ARRAY'
+                            WHEN btn.nspname = 'pg_catalog'
+                                THEN format_type(t.typbasetype, NULL)
+                            ELSE 'USER-DEFINED'
+                        END
+                    WHEN t.typelem <> 0 AND t.typlen = -1 THEN 'ARRAY'
+                    WHEN tn.nspname = 'pg_catalog' THEN format_type(a.atttypid, NULL)
+                    ELSE 'USER-DEFINED'
+                END,
+                NOT (a.attnotnull OR (t.typtype = 'd' AND t.typnotnull))
+            FROM pg_attribute a
+            JOIN pg_class c ON a.attrelid = c.oid
+            JOIN pg_namespace n ON c.relnamespace = n.oid
+            JOIN pg_type t ON a.atttypid = t.oid
+            JOIN pg_namespace tn ON t.typnamespace = tn.oid
+            LEFT JOIN (pg_type bt JOIN pg_namespace btn ON bt.typnamespace = btn.oid)
+                ON t.typtype = 'd' AND t.typbasetype = bt.oid
+            WHERE c.relname = %s AND n.nspname = %s
+                AND c.relkind IN ('r', 'v', 'f', 'p')
+                AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY a.attnum;
         """
-        with self._lock:
-            self.cursor.execute(query, (table_name, schema))
-            rows = self.cursor.fetchall()
+        with self.connection.cursor() as cursor:
+            cursor.execute(query, (table_name, schema))
+            rows = cursor.fetchall()
 
         schema_props = {}
         for column_name, type_name, is_nullable in rows:
-            assert is_nullable in ("YES", "NO")
-            schema_props[column_name] = ColumnProperties(
-                type_name.lower(), is_nullable == "YES"
-            )
-        return schema_props
+            schema_props[column_name] = ColumnProperties(type_name.lower(), is_nullable)
+        if schema_props:
+            self._schema_cache[(table_name, schema)] = schema_props
+        return dict(schema_props)
 
     def insert_row(
         self, table_name: str, values: dict[str, int | bool | str | float]
     ) -> None:
-        field_names = []
-        field_values = []
-        for key, value in values.items():
-            field_names.append(key)
-            if isinstance(value, str):
-                field_values.append(f"'{value}'")
-            elif value is True:
-                field_values.append("'t'")
-            elif value is False:
-                field_values.append("'f'")
-            else:
-                field_values.append(str(value))
-        condition = f'INSERT INTO {table_name} ({",".join(field_names)}) VALUES ({",".join(field_values)})'
-        print(f"Inserting a row: {condition}")
-        with self._lock:
-            self.cursor.execute(condition)
+        query = _insert_sql(table_name, tuple(values))
+        with self.connection.cursor() as cursor:
+            cursor.execute(query, list(values.values()))
+
+    def insert_rows(
+        self, table_name: str, rows: list[dict[str, int | bool | str | float]]
+    ) -> None:
+        """Insert ``rows`` with a single multi-row ``INSERT`` (one round trip
+        per 1000 rows). Columns are the union of the rows' keys; a row missing
+        one of them gets ``NULL`` there."""
+        if not rows:
+            return
+        field_names = list(dict.fromkeys(key for row in rows for key in row))
+        query = f'INSERT INTO {table_name} ({",".join(field_names)}) VALUES %s'
+        with self.connection.cursor() as cursor:
+            execute_values(
+                cursor,
+                query,
+                [tuple(row.get(key) for key in field_names) for row in rows],
+                page_size=1000,
+            )
 
     def create_table(self, schema: type[pw.Schema], *, add_special_fields: bool) -> str:
         table_name = self.random_table_name()
-
-        primary_key_found = False
-        fields = []
-        for field_name, field_schema in schema.columns().items():
-            parts = [field_name]
-            field_type = field_schema.dtype
-            if field_type == dtype.STR:
-                parts.append("TEXT")
-            elif field_type == dtype.INT:
-                parts.append("BIGINT")
-            elif field_type == dtype.FLOAT:
-                parts.append("DOUBLE PRECISION")
-            elif field_type == dtype.BOOL:
-                parts.append("BOOLEAN")
-            elif isinstance(field_type, dtype.Array) and "_vector" in field_name:
-                # hack to create an array with a specific type
-                parts.append("VECTOR")
-            elif isinstance(field_type, dtype.Array) and "_halfvec" in field_name:
-                # hack to create an array with a specific type
-                parts.append("HALFVEC")
-            else:
-                raise RuntimeError(f"This test doesn't support field type {field_type}")
-            if field_schema.primary_key:
-                assert (
-                    not primary_key_found
-                ), "This test only supports simple primary keys"
-                primary_key_found = True
-                parts.append("PRIMARY KEY NOT NULL")
-            fields.append(" ".join(parts))
-
-        if add_special_fields:
-            fields.append("time BIGINT NOT NULL")
-            fields.append("diff BIGINT NOT NULL")
-
-        with self._lock:
-            self.cursor.execute(
+        fields = _build_create_table(
+            _PG_TYPEMAP,
+            schema,
+            "",
+            add_special_fields=add_special_fields,
+            # hack to create an array with a specific type
+            array_types={"_vector": "VECTOR", "_halfvec": "HALFVEC"},
+        )
+        with self.connection.cursor() as cursor:
+            cursor.execute(
                 f'CREATE TABLE IF NOT EXISTS {table_name} ({",".join(fields)})'
             )
+        self._schema_cache.clear()
 
         return table_name
 
@@ -566,38 +788,32 @@ class WireProtocolSupporterContext:
                 return [convert_value(v) for v in value]
             return value
 
-        select_query = f'SELECT {",".join(column_names)} FROM {table_name};'
-        with self._lock:
-            self.cursor.execute(select_query)
-            rows = self.cursor.fetchall()
-        result = []
-        for row in rows:
-            row_map = {}
-            for name, value in zip(column_names, row):
-                row_map[name] = convert_value(value)
-            result.append(row_map)
-        if sort_by is not None:
-            if isinstance(sort_by, tuple):
-                result.sort(key=lambda item: tuple(item[key] for key in sort_by))
-            else:
-                result.sort(key=lambda item: item[sort_by])
-        return result
+        order_by = _order_by_clause(sort_by, column_names)
+        select_query = f'SELECT {",".join(column_names)} FROM {table_name}{order_by};'
+        # Rows are keyed by ``column_names`` exactly as given (``'"time"'``
+        # stays quoted), so this builds the dicts itself rather than using
+        # ``RealDictCursor``, which keys them by the server's column labels.
+        # Iterating the cursor skips the intermediate ``fetchall`` list.
+        with self.connection.cursor() as cursor:
+            cursor.execute(select_query)
+            return [dict(zip(column_names, map(convert_value, row))) for row in cursor]
 
     def count_rows(self, table_name: str) -> int:
-        """Server-side ``SELECT count(*)``, serialized on the context lock.
+        """Server-side ``SELECT count(*)`` on a cursor of its own.
 
         Checkers must use this instead of touching ``self.cursor`` directly:
         an unguarded execute/fetch pair interleaves with whatever another
-        thread runs through the same cursor and reads the wrong result set
+        thread runs through the shared cursor and reads the wrong result set
         (see the lock's comment in ``__init__``).
         """
-        with self._lock:
-            self.cursor.execute(f'SELECT count(*) FROM "{table_name}"')
-            return self.cursor.fetchone()[0]
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM "{table_name}"')
+            return cursor.fetchone()[0]
 
     def execute_sql(self, query: str):
         with self._lock:
             self.cursor.execute(query)
+        self._schema_cache.clear()
 
     def execute_sql_with_retry(self, query: str, max_retries: int = 6) -> None:
         """``execute_sql`` with retry on PostgreSQL catalog concurrency
@@ -622,6 +838,7 @@ class WireProtocolSupporterContext:
             try:
                 with self._lock:
                     self.cursor.execute(query)
+                self._schema_cache.clear()
                 return
             except psycopg2.Error as e:
                 msg = str(e)
@@ -637,7 +854,7 @@ class WireProtocolSupporterContext:
                 time.sleep(0.1 * (1.5**attempt) + random.uniform(0, 0.05))
 
     def random_table_name(self) -> str:
-        return f'wire_{str(uuid.uuid4()).replace("-", "")}'
+        return f"wire_{uuid.uuid4().hex}"
 
     @contextmanager
     def publication(self, table_name: str):
@@ -791,7 +1008,7 @@ class NeonContext(WireProtocolSupporterContext):
         self._tracked_tables.clear()
 
         try:
-            self.connection.close()
+            self.close()
         except Exception:
             pass
 
@@ -835,7 +1052,7 @@ class QuestDBContext(WireProtocolSupporterContext):
                 return
             except Exception:
                 try:
-                    self.connection.close()
+                    self.close(discard=True)
                 except Exception:
                     pass
                 if time.monotonic() >= deadline:
@@ -923,10 +1140,8 @@ class ClickHouseContext:
         # as-is.
         result = [dict(row) for row in data]
         if sort_by is not None:
-            if isinstance(sort_by, tuple):
-                result.sort(key=lambda item: tuple(item[key] for key in sort_by))
-            else:
-                result.sort(key=lambda item: item[sort_by])
+            keys = sort_by if isinstance(sort_by, tuple) else (sort_by,)
+            result.sort(key=operator.itemgetter(*keys))
         return result
 
 
@@ -1536,14 +1751,14 @@ class MongoDBContext:
 
     def __init__(self):
         self.client = MongoClient(MONGODB_CONNECTION_STRING)
+        self.db = self.client[MONGODB_BASE_NAME]
 
     def generate_collection_name(self) -> str:
-        table_name = f'mongodb_{str(uuid.uuid4()).replace("-", "")}'
+        table_name = f"mongodb_{uuid.uuid4().hex}"
         return table_name
 
     def collection_exists(self, collection_name: str) -> bool:
-        db = self.client[MONGODB_BASE_NAME]
-        return collection_name in db.list_collection_names()
+        return collection_name in self.db.list_collection_names()
 
     def get_full_collection(self, collection_name):
         # Read with the default ("local") read concern, NOT "majority". The tests
@@ -1556,28 +1771,25 @@ class MongoDBContext:
         # data is present (it would appear a few hundred ms later). Reading the
         # primary with the default concern returns the same committed state the
         # poll observed.
-        db = self.client[MONGODB_BASE_NAME]
-        return list(db[collection_name].find({}, {"_id": 0}))
+        return list(self.db[collection_name].find({}, {"_id": 0}))
 
     def get_collection(
         self, collection_name: str, field_names: list[str]
     ) -> list[dict[str, str | int | bool | float]]:
-        db = self.client[MONGODB_BASE_NAME]
-        collection = db[collection_name]
-        data = collection.find()
-        result = []
-        for document in data:
-            entry = {}
-            for field_name in field_names:
-                entry[field_name] = document[field_name]
-            result.append(entry)
-        return result
+        collection = self.db[collection_name]
+        # Project server-side so only the requested fields cross the wire.
+        projection = {field_name: 1 for field_name in field_names}
+        projection.setdefault("_id", 0)
+        data = collection.find({}, projection).batch_size(1000)
+        return [
+            {field_name: document[field_name] for field_name in field_names}
+            for document in data
+        ]
 
     def insert_document(
         self, collection_name: str, document: dict[str, int | bool | str | float]
     ) -> None:
-        db = self.client[MONGODB_BASE_NAME]
-        collection = db[collection_name]
+        collection = self.db[collection_name]
         collection.insert_one(document)
 
     def replace_document(
@@ -1586,15 +1798,18 @@ class MongoDBContext:
         filter: dict,
         replacement: dict[str, int | bool | str | float],
     ) -> None:
-        db = self.client[MONGODB_BASE_NAME]
-        collection = db[collection_name]
+        collection = self.db[collection_name]
         collection.replace_one(filter, replacement)
 
     def delete_document(self, collection_name: str, filter: dict) -> None:
-        db = self.client[MONGODB_BASE_NAME]
-        collection = db[collection_name]
+        collection = self.db[collection_name]
         collection.delete_one(filter)
 
+    def count_rows(self, collection_name: str) -> int:
+        # ``count_documents`` rather than ``estimated_document_count``: the
+        # latter reads collection metadata, which is not guaranteed to be exact.
+        return self.db[collection_name].count_documents({})
+
 
 class AtlasContext:
     """Helper for the ``mongodb-atlas`` compose service (MongoDB Atlas Local).
@@ -1701,26 +1916,84 @@ class AtlasContext:
 
 class DebeziumContext:
 
+    def __init__(self):
+        # One keep-alive session for every Debezium REST call, so the readiness
+        # polls and registration retries reuse the same TCP connection instead
+        # of handshaking again each time. urllib3's own retries are off: the
+        # loops below already retry, with backoff. The pool holds a few sockets
+        # so that concurrent ``register_*_async`` calls each keep theirs.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=4, max_retries=Retry(total=0)
+        )
+        self._session.mount("http://", adapter)
+
+    def _wait_until_ready(self, deadline: float) -> None:
+        """Poll the Kafka Connect root endpoint with exponential backoff until
+        it answers, so an already healthy Debezium is detected in one cheap
+        ``GET`` instead of after a fixed sleep."""
+        delay = 0.05
+        while True:
+            try:
+                if self._session.get(DEBEZIUM_URL, timeout=5).status_code == 200:
+                    return
+            except requests.RequestException as e:
+                print(f"Debezium is not ready yet: {e}")
+            if time.monotonic() >= deadline:
+                raise RuntimeError("Debezium did not become ready")
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
+
+    def _connector_exists(self, name: str) -> bool:
+        try:
+            r = self._session.get(f"{DEBEZIUM_CONNECTOR_URL}/{name}", timeout=5)
+        except requests.RequestException:
+            return False
+        return r.status_code // 100 == 2
+
+    def delete_connector(self, name: str) -> None:
+        r = self._session.delete(f"{DEBEZIUM_CONNECTOR_URL}/{name}", timeout=60)
+        if r.status_code // 100 != 2 and r.status_code != 404:
+            raise RuntimeError(
+                f"Failed to delete Debezium connector {name}. Code: {r.status_code}. Text: {r.text}"
+            )
+
     def _register_connector(self, payload: dict, result_on_ok: str) -> str:
-        for _ in range(300):
+        deadline = time.monotonic() + DEBEZIUM_REGISTER_TIMEOUT_SEC
+        self._wait_until_ready(deadline)
+        # Connect can still refuse the first registration for a moment after
+        # it starts answering (e.g. while a worker rebalance is in progress),
+        # so keep retrying with the same backoff until the deadline.
+        delay = 0.05
+        while True:
             try:
-                r = requests.post(DEBEZIUM_CONNECTOR_URL, timeout=60, json=payload)
-                is_ok = r.status_code // 100 == 2
-            except Exception as e:
+                r = self._session.post(DEBEZIUM_CONNECTOR_URL, timeout=5, json=payload)
+            except requests.RequestException as e:
+                # Connect validates the config against the source database
+                # before answering, which can outlast our timeout under load.
+                # It keeps processing the request regardless, so the connector
+                # may exist by now.
+                if self._connector_exists(payload["name"]):
+                    return result_on_ok
                 print(f"Debezium is not ready to register connector yet: {e}")
-                time.sleep(1.0)
-                continue
-            if is_ok:
-                return result_on_ok
             else:
+                if r.status_code // 100 == 2:
+                    return result_on_ok
+                # 409 is "already exists" when an earlier, timed-out attempt
+                # went through -- but also what Connect answers during a
+                # rebalance, so confirm the connector is really there.
+                if r.status_code == 409 and self._connector_exists(payload["name"]):
+                    return result_on_ok
                 print(
                     f"Debezium is not ready to register connector yet. Code: {r.status_code}. Text: {r.text}"
                 )
-                time.sleep(1.0)
-        raise RuntimeError("Failed to register Debezium connector")
+            if time.monotonic() >= deadline:
+                raise RuntimeError("Failed to register Debezium connector")
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
 
     def register_mongodb(self) -> str:
-        connector_id = str(uuid.uuid4()).replace("-", "")
+        connector_id = uuid.uuid4().hex
         payload = {
             "name": f"values-connector-{connector_id}",
             "config": {
@@ -1735,7 +2008,7 @@ class DebeziumContext:
         return self._register_connector(payload, f"{connector_id}.{MONGODB_BASE_NAME}.")
 
     def register_postgres(self, table_name: str) -> str:
-        connector_id = str(uuid.uuid4()).replace("-", "")
+        connector_id = uuid.uuid4().hex
         payload = {
             "name": f"values-connector-{connector_id}",
             "config": {
@@ -1748,30 +2021,75 @@ class DebeziumContext:
                 "database.dbname": str(POSTGRES_DB_NAME),
                 "database.server.name": connector_id,
                 "table.include.list": f"public.{table_name}",
+                # One replication slot per connector, so connectors registered
+                # side by side don't fight over Debezium's default slot; drop
+                # it once the connector is deleted so it stops retaining WAL.
+                "slot.name": f"debezium_{connector_id}",
+                "slot.drop.on.stop": "true",
                 "database.history.kafka.bootstrap.servers": KAFKA_BOOTSTRAP_SERVERS,
             },
         }
         return self._register_connector(payload, f"{connector_id}.public.{table_name}")
 
+    # Registration mostly waits on Debezium, so run it in a worker thread:
+    # several connectors can then be registered concurrently with
+    # ``asyncio.gather`` instead of one readiness wait after another.
+    async def register_mongodb_async(self) -> str:
+        return await asyncio.to_thread(self.register_mongodb)
+
+    async def register_postgres_async(self, table_name: str) -> str:
+        return await asyncio.to_thread(self.register_postgres, table_name)
+
 
 class DynamoDBContext:
+    # ``get_table_contents`` reads the table as a parallel scan of this many
+    # segments, each paginated on its own thread.
+    SCAN_SEGMENTS = 8
 
     def __init__(self):
         self.dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
 
     def get_table_contents(self, table_name: str) -> list[dict]:
-        table = self.dynamodb.Table(table_name)
-        response = table.scan()
-        data = response["Items"]
+        segments = self._parallel_scan(table_name)
+        return [item for pages in segments for page in pages for item in page["Items"]]
 
-        while "LastEvaluatedKey" in response:
-            response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            data.extend(response["Items"])
+    def count_rows(self, table_name: str) -> int:
+        """Exact item count via a ``Select="COUNT"`` scan, which returns only
+        per-page counts. ``describe_table``'s ``ItemCount`` is refreshed only
+        every few hours, so it cannot be polled.
+
+        Scanned serially: this is polled in a loop, the pages carry no items,
+        and a per-poll thread pool would cost more than it saves."""
+        paginator = self.dynamodb.meta.client.get_paginator("scan")
+        return sum(
+            page["Count"]
+            for page in paginator.paginate(TableName=table_name, Select="COUNT")
+        )
 
-        return data
+    def _parallel_scan(self, table_name: str) -> list[list[dict]]:
+        with ThreadPoolExecutor(max_workers=self.SCAN_SEGMENTS) as executor:
+            return list(
+                executor.map(
+                    lambda segment: self._scan_segment(table_name, segment),
+                    range(self.SCAN_SEGMENTS),
+                )
+            )
+
+    def _scan_segment(self, table_name: str, segment: int) -> list[dict]:
+        # Resources are not thread-safe but their client is; it carries the
+        # resource's (de)serialization hooks, so items come back as the same
+        # Python values ``Table.scan`` would return.
+        paginator = self.dynamodb.meta.client.get_paginator("scan")
+        return list(
+            paginator.paginate(
+                TableName=table_name,
+                Segment=segment,
+                TotalSegments=self.SCAN_SEGMENTS,
+            )
+        )
 
     def generate_table_name(self) -> str:
-        return "table" + str(uuid.uuid4())
+        return f"table_{uuid.uuid4().hex}"
 
 
 class ElasticsearchContext:
@@ -1820,7 +2138,7 @@ class ElasticsearchContext:
         raise last_exc
 
     def generate_index_name(self) -> str:
-        return f'es_{str(uuid.uuid4()).replace("-", "")}'
+        return f"es_{uuid.uuid4().hex}"
 
     def create_index(
         self,
@@ -2021,81 +2339,94 @@ class MySQLContext:
     def __init__(self, host: str = MYSQL_DB_HOST):
         self.host = host
         self.connection_string = mysql_connection_string(host)
-        self.connection = _connect_to_mysql(host)
+        self.connection = _acquire_mysql_connection(host)
+        # Kept for the ad-hoc statements tests issue directly; the helpers
+        # below each use a short-lived cursor of their own.
         self.cursor = self.connection.cursor()
+        # ``get_table_schema`` results by table name, dropped by ``create_table``.
+        self._schema_cache: dict[str, dict[str, ColumnProperties]] = {}
+        # Server-side prepared statement for ``insert_row``; the cursor
+        # re-prepares only when the statement text changes, so repeated inserts
+        # into one table skip the parse.
+        self._insert_cursor = self.connection.cursor(prepared=True)
 
     def close(self) -> None:
-        """Close the underlying connection.
+        """Release the underlying connection.
 
         Each ``MySQLContext`` holds one server connection for its whole
         lifetime. Left to garbage collection, dozens of them linger across an
         ``xdist`` run and crowd out the small per-writer pools, which is exactly
         what manifests as a flaky ``ERROR 1040 (Too many connections)``. Closing
         promptly — on fixture teardown and when a helper thread finishes — keeps
-        the live connection count bounded and deterministic.
+        the live connection count bounded and deterministic. A pooled connection
+        is returned to the pool for the next context instead of being closed.
         """
+        try:
+            self._insert_cursor.close()
+        except Exception:
+            pass
         try:
             self.connection.close()
         except Exception:
             pass
 
     def get_table_schema(self, table_name: str) -> dict[str, ColumnProperties]:
+        cached = self._schema_cache.get(table_name)
+        if cached is not None:
+            return dict(cached)
+
         query = """
             SELECT column_name, data_type, is_nullable
             FROM information_schema.columns
             WHERE table_name = %s AND table_schema = %s
             ORDER BY ordinal_position;
         """
-        self.cursor.execute(query, (table_name, self.connection.database))
-        rows = self.cursor.fetchall()
+        with closing(self.connection.cursor()) as cursor:
+            cursor.execute(query, (table_name, self.connection.database))
+            rows = cursor.fetchall()
 
         schema_props: dict[str, ColumnProperties] = {}
         for column_name, type_name, is_nullable in rows:
             schema_props[str(column_name)] = ColumnProperties(
                 str(type_name).lower(), str(is_nullable).upper() == "YES"
             )
-        return schema_props
+        if schema_props:
+            self._schema_cache[table_name] = schema_props
+        return dict(schema_props)
 
     def insert_row(
         self, table_name: str, values: dict[str, Union[int, bool, str, float]]
     ) -> None:
-        field_names = list(values.keys())
-        placeholders = ", ".join(["%s"] * len(values))
+        query = _insert_sql(table_name, tuple(values))
+        logging.debug("Inserting a row: %s", query)
+        self._insert_cursor.execute(query, tuple(values.values()))
+
+    def insert_rows(
+        self, table_name: str, rows: list[dict[str, Union[int, bool, str, float]]]
+    ) -> None:
+        """Insert ``rows`` through one ``executemany``, which the driver
+        rewrites into a single multi-row ``INSERT``. Columns are the union of
+        the rows' keys; a row missing one of them gets ``NULL`` there."""
+        if not rows:
+            return
+        field_names = list(dict.fromkeys(key for row in rows for key in row))
+        placeholders = ", ".join(["%s"] * len(field_names))
         query = f"INSERT INTO {table_name} ({','.join(field_names)}) VALUES ({placeholders})"
-        print(f"Inserting a row: {query}")
-        self.cursor.execute(query, tuple(values.values()))
+        logging.debug("Inserting %d row(s): %s", len(rows), query)
+        with closing(self.connection.cursor()) as cursor:
+            cursor.executemany(
+                query, [tuple(row.get(key) for key in field_names) for row in rows]
+            )
 
     def create_table(self, schema: type[pw.Schema], *, add_special_fields: bool) -> str:
         table_name = self.random_table_name()
-
-        primary_key_found = False
-        fields = []
-        for field_name, field_schema in schema.columns().items():
-            parts = [f"`{field_name}`"]
-            field_type = field_schema.dtype
-            if field_type == dtype.STR:
-                parts.append("VARCHAR(255)")
-            elif field_type == dtype.INT:
-                parts.append("BIGINT")
-            elif field_type == dtype.FLOAT:
-                parts.append("DOUBLE")
-            elif field_type == dtype.BOOL:
-                parts.append("BOOLEAN")
-            else:
-                raise RuntimeError(f"Unsupported field type {field_type}")
-            if field_schema.primary_key:
-                if primary_key_found:
-                    raise AssertionError("Only single primary key supported")
-                primary_key_found = True
-                parts.append("PRIMARY KEY NOT NULL")
-            fields.append(" ".join(parts))
-
-        if add_special_fields:
-            fields.append("`time` BIGINT NOT NULL")
-            fields.append("`diff` BIGINT NOT NULL")
-
+        fields = _build_create_table(
+            _MYSQL_TYPEMAP, schema, "`", add_special_fields=add_special_fields
+        )
         create_sql = f"CREATE TABLE IF NOT EXISTS {table_name} ({','.join(fields)})"
-        self.cursor.execute(create_sql)
+        with closing(self.connection.cursor()) as cursor:
+            cursor.execute(create_sql)
+        self._schema_cache.clear()
         return table_name
 
     def get_table_contents(
@@ -2104,19 +2435,17 @@ class MySQLContext:
         column_names: list[str],
         sort_by: Union[str, tuple, None] = None,
     ) -> list[dict[str, Union[str, int, bool, float]]]:
-        select_query = f"SELECT {','.join(column_names)} FROM {table_name};"
-        self.cursor.execute(select_query)
-        rows = self.cursor.fetchall()
-        result = []
-        for row in rows:
-            row_map = dict(zip(column_names, row))
-            result.append(row_map)
-        if sort_by is not None:
-            if isinstance(sort_by, tuple):
-                result.sort(key=lambda item: tuple(item[key] for key in sort_by))
-            else:
-                result.sort(key=lambda item: item[sort_by])
-        return result
+        order_by = _order_by_clause(sort_by, column_names)
+        select_query = f"SELECT {','.join(column_names)} FROM {table_name}{order_by};"
+        with closing(self.connection.cursor()) as cursor:
+            cursor.execute(select_query)
+            rows = cursor.fetchall()
+        return [dict(zip(column_names, row)) for row in rows]
+
+    def count_rows(self, table_name: str) -> int:
+        with closing(self.connection.cursor()) as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            return cursor.fetchone()[0]
 
     def random_table_name(self) -> str:
         return f"mysql_{uuid.uuid4().hex}"
@@ -2679,10 +3008,8 @@ class MssqlContext:
             row_map = dict(zip(column_names, row))
             result.append(row_map)
         if sort_by is not None:
-            if isinstance(sort_by, tuple):
-                result.sort(key=lambda item: tuple(item[key] for key in sort_by))
-            else:
-                result.sort(key=lambda item: item[sort_by])
+            keys = sort_by if isinstance(sort_by, tuple) else (sort_by,)
+            result.sort(key=operator.itemgetter(*keys))
         return result
 
     def get_table_schema(self, table_name: str) -> dict[str, ColumnProperties]:
@@ -2703,7 +3030,48 @@ class MssqlContext:
         return schema_props
 
 
+def build_contexts(context_classes: Sequence[type]) -> dict[type, Any]:
+    """Construct every context in ``context_classes`` concurrently and return
+    the instances by class.
+
+    Constructors block on connecting (and some on waiting for the server to be
+    ready), so a test that needs several contexts pays the slowest connect
+    rather than the sum of them. If any constructor fails, the contexts that
+    were built are closed before the first error is re-raised. The caller must
+    already hold the servers' concurrency slots (e.g.
+    ``postgres_concurrency_slot``), as the fixtures do.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(context_classes), 1)) as executor:
+        futures = {cls: executor.submit(cls) for cls in context_classes}
+    contexts = {}
+    errors = []
+    for cls, future in futures.items():
+        try:
+            contexts[cls] = future.result()
+        except Exception as e:
+            errors.append(e)
+    if errors:
+        for context in contexts.values():
+            close = getattr(context, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    logging.warning(f"Failed to close {type(context).__name__}: {e}")
+        raise errors[0]
+    return contexts
+
+
 class EntryCountChecker:
+    """Polls until the table holds exactly ``n_expected_entries`` rows.
+
+    Contexts exposing ``count_rows`` are asked for the count server-side;
+    others (or calls with ``get_table_contents`` arguments that can change the
+    row count, such as ClickHouse's ``final_``) fetch the contents instead.
+    """
+
+    # ``get_table_contents`` arguments that don't affect how many rows it returns.
+    _COUNT_NEUTRAL_KWARGS = frozenset({"table_name", "column_names", "sort_by"})
 
     def __init__(
         self,
@@ -2714,15 +3082,23 @@ class EntryCountChecker:
         self.n_expected_entries = n_expected_entries
         self.db_context = db_context
         self.get_table_contents_kwargs = get_table_contents_kwargs
+        self._use_count_rows = hasattr(
+            db_context, "count_rows"
+        ) and self._COUNT_NEUTRAL_KWARGS.issuperset(get_table_contents_kwargs)
 
     def __call__(self) -> bool:
         try:
-            table_contents = self.db_context.get_table_contents(
-                **self.get_table_contents_kwargs
-            )
+            if self._use_count_rows:
+                n_entries = self.db_context.count_rows(
+                    self.get_table_contents_kwargs["table_name"]
+                )
+            else:
+                n_entries = len(
+                    self.db_context.get_table_contents(**self.get_table_contents_kwargs)
+                )
         except Exception:
             return False
-        return len(table_contents) == self.n_expected_entries
+        return n_entries == self.n_expected_entries
 
 
 class RowCountChecker: